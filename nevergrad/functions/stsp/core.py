@@ -9,37 +9,61 @@
 # - Guenter Rudolph
 # - Jialin Liu
 
-import matplotlib.pyplot as plt
+from collections import OrderedDict
 import numpy as np
 from nevergrad import instrumentation as inst
 from ..base import ExperimentFunction
 
 
+def _tour_length(xy: np.ndarray, order: np.ndarray) -> float:
+    """Length of the closed tour visiting the points of coordinates xy (packed as x + 1j * y) in the provided order
+    """
+    ordered = xy[order]
+    # the absolute value of a complex number is the euclidean norm of the corresponding 2d vector
+    closing = abs(ordered.item(0) - ordered.item(-1))  # python scalars, to avoid numpy scalar dispatch
+    return float(np.abs(ordered[1:] - ordered[:-1]).sum()) + closing
+
+
 class STSP(ExperimentFunction):
 
+    _sort_cache_size = 128  # maximum number of tour orders to keep in memory
+    _sort_cache_bytes = 2**26  # memory budget of the cache (keys and orders), which limits its size in large dimension
+
     def __init__(self, dimension: int = 500) -> None:
         super().__init__(self._simulate_stsp, inst.var.Array(dimension))
         self.register_initialization(dimension=dimension)
         self.order = np.arange(0, self.dimension)
-        self.x = self.parametrization.random_state.normal(size=self.dimension)
-        self.y = self.parametrization.random_state.normal(size=self.dimension)
+        # single draw (same values as drawing x then y), from the random state of the parametrization for reproducibility
+        self.x, self.y = self.parametrization.random_state.normal(size=(2, self.dimension))
+        self._sort_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._sort_cache_size = max(1, min(self._sort_cache_size, self._sort_cache_bytes // (16 * self.dimension)))
+        self._xy = self.x + 1j * self.y  # a single gather per point, and a single ufunc for the edge lengths
+
+    def _get_order(self, x: np.ndarray) -> np.ndarray:
+        """Returns the tour order (argsort) of the input, reusing the result if the same
+        input was recently evaluated (eg: when re-evaluating a candidate)
+        """
+        x = np.asarray(x, dtype=float)
+        key = x.tobytes()
+        order = self._sort_cache.get(key)
+        if order is None:
+            order = np.argsort(x)
+            order.flags.writeable = False  # shared through the cache
+            self._sort_cache[key] = order
+            if len(self._sort_cache) > self._sort_cache_size:
+                self._sort_cache.popitem(last=False)
+        return order
 
     def _simulate_stsp(self, x: np.ndarray) -> float:
-        order = np.argsort(x)
+        order = self._get_order(x)
         self.order = order
-        x = self.x[order]
-        y = self.y[order]
-        output = np.sqrt((x[0] - x[-1])**2 + (y[0] - y[-1])**2) + sum(np.sqrt((x[i] - x[i + 1])**2 + (y[i] - y[i + 1])**2)
-                                                                      for i in range(self.dimension - 1))
-        return float(output)
+        return _tour_length(self._xy, order)
 
     def make_plots(self, filename: str = "stsp.png") -> None:
+        import matplotlib.pyplot as plt
         plt.clf()
         # Plot the optimization run.
         ax = plt.subplot(1, 1, 1)
         ax.set_xlabel('iteration number')
-        order = self.order
-        x = self.x
-        y = self.y
-        ax.plot((x[o] for o in order), (y[o] for o in order))
+        ax.plot(self.x[self.order], self.y[self.order])
         plt.savefig(filename)
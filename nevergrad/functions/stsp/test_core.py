@@ -12,3 +12,41 @@ def test_stsp() -> None:
     x = 7 * np.random.rand(func.dimension)
     value = func(x)  # should not touch boundaries, so value should be < np.inf
     assert value < np.inf
+
+
+def test_stsp_tour_length() -> None:
+    func = core.STSP(dimension=12)
+    x = np.random.rand(func.dimension)
+    order = np.argsort(x)
+    points = list(zip(func.x[order], func.y[order]))
+    expected = sum(np.sqrt((p[0] - q[0])**2 + (p[1] - q[1])**2) for p, q in zip(points, points[1:] + points[:1]))
+    np.testing.assert_almost_equal(func(x), expected)
+    np.testing.assert_array_equal(func.order, order)
+
+
+def test_stsp_zeros() -> None:
+    # all-zeros is the first candidate of many optimizers: ties must be ordered as by the default argsort
+    func = core.STSP()
+    order = np.argsort(np.zeros(func.dimension))
+    x, y = func.x[order], func.y[order]
+    expected = np.sqrt((x[0] - x[-1])**2 + (y[0] - y[-1])**2) + sum(np.sqrt((x[i] - x[i + 1])**2 + (y[i] - y[i + 1])**2)
+                                                                    for i in range(func.dimension - 1))
+    np.testing.assert_almost_equal(func(np.zeros(func.dimension)), expected)
+
+
+def test_stsp_sort_cache() -> None:
+    func = core.STSP(dimension=5)
+    x = np.random.rand(func.dimension)
+    value = func(x)
+    order = func.order
+    assert func(x.copy()) == value
+    assert func.order is order  # reused from the cache
+    for _ in range(func._sort_cache_size + 1):
+        func(np.random.rand(func.dimension))
+    assert len(func._sort_cache) == func._sort_cache_size
+    assert x.tobytes() not in func._sort_cache
+
+
+def test_stsp_sort_cache_size() -> None:
+    assert core.STSP(dimension=500)._sort_cache_size == 128
+    assert core.STSP(dimension=100000)._sort_cache_size == 41
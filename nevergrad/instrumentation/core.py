@@ -146,7 +146,7 @@ class Variable:
         """
         # trigger random_state creation (may require to be propagated to sub-variables
         assert self.random_state is not None
-        array = np.array(data, copy=False)
+        array = data if isinstance(data, np.ndarray) else np.asarray(data)
         if array.shape != (self.dimension,):
             raise ValueError(f"Unexpected shape {array.shape} of {array} for {self} with dimension {self.dimension}")
         return self._data_to_arguments(array, deterministic)
@@ -155,7 +155,7 @@ class Variable:
         raise NotImplementedError
 
     def get_summary(self, data: ArrayLike) -> str:  # pylint: disable=unused-argument
-        output = self.data_to_arguments(np.array(data, copy=False), deterministic=True)
+        output = self.data_to_arguments(data, deterministic=True)
         return f"Value {output[0][0]}, from data: {data}"
 
     def freeze(self) -> None:
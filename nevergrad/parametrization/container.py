@@ -36,8 +36,8 @@ class Tuple(Dict):
 
     @property  # type: ignore
     def value(self) -> tp.Tuple[tp.Any, ...]:  # type: ignore
-        param_val = [x[1] for x in sorted(self._parameters.items(), key=lambda x: int(x[0]))]
-        return tuple(p.value if isinstance(p, core.Parameter) else p for p in param_val)
+        # subparameters are all Parameter instances (non-parameters are wrapped into a Constant at initialization)
+        return tuple(self._parameters[k].value for k in range(len(self._parameters)))
 
     @value.setter
     def value(self, value: tp.Tuple[tp.Any]) -> None:
@@ -458,7 +458,7 @@ class Dict(Parameter):
 
     @property
     def value(self) -> tp.Dict[str, tp.Any]:
-        return {k: as_parameter(p).value for k, p in self._parameters.items()}
+        return {k: p.value for k, p in self._parameters.items()}
 
     @value.setter
     def value(self, value: tp.Dict[str, tp.Any]) -> None:
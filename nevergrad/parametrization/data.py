@@ -55,6 +55,12 @@ class BoundChecker:
         return True
 
 
+def _is_unit(sigma: tp.Union[float, np.ndarray]) -> bool:
+    """Checks whether sigma is the scalar 1, in which case scaling can be skipped
+    """
+    return not isinstance(sigma, np.ndarray) and sigma == 1.0
+
+
 # pylint: disable=too-many-arguments
 class Array(core.Parameter):
     """Array variable of a given shape.
@@ -119,7 +125,9 @@ class Array(core.Parameter):
     def sigma(self) -> tp.Union["Array", "Scalar"]:
         """Value for the standard deviation used to mutate the parameter
         """
-        return self.subparameters["sigma"]  # type: ignore
+        # direct access, since this is called at each conversion from/to the standardized space
+        # (subparameters are always instantiated in __init__ for arrays)
+        return self._subparameters._parameters["sigma"]  # type: ignore
 
     @property
     def value(self) -> np.ndarray:
@@ -134,7 +142,7 @@ class Array(core.Parameter):
             raise TypeError(f"Received a {type(value)} in place of a np.ndarray")
         if self._value.shape != value.shape:
             raise ValueError(f"Cannot set array of shape {self._value.shape} with value of shape {value.shape}")
-        if not BoundChecker(*self.bounds)(self.value):
+        if (self.bounds[0] is not None or self.bounds[1] is not None) and not BoundChecker(*self.bounds)(value):
             raise ValueError("New value does not comply with bounds")
         if self.exponent is not None and np.min(value.ravel()) <= 0:
             raise ValueError("Logirithmic values cannot be negative")
@@ -264,7 +272,8 @@ class Array(core.Parameter):
     def _internal_set_standardized_data(self: A, data: np.ndarray, instance: A, deterministic: bool = False) -> A:
         assert isinstance(data, np.ndarray)
         sigma = self.sigma.value
-        data_reduc = (sigma * data).reshape(instance._value.shape)
+        # skip the multiplication in the (most common) unit sigma case, but still provide a new float array
+        data_reduc = (np.array(data, dtype=float) if _is_unit(sigma) else sigma * data).reshape(instance._value.shape)
         instance._value = data_reduc if self.exponent is None else self.exponent**data_reduc
         if instance.bound_transform is not None:
             instance._value = instance.bound_transform.forward(instance._value)
@@ -288,14 +297,18 @@ class Array(core.Parameter):
         if self.bound_transform is not None:
             data = self.bound_transform.backward(data)
         distribval = data if self.exponent is None else np.log(data) / np.log(self.exponent)
-        reduced = distribval / sigma
+        # copy in the unit sigma case as well, so that the data never shares memory with the instance
+        reduced = np.array(distribval, dtype=float) if _is_unit(sigma) else distribval / sigma
         return reduced.ravel()  # type: ignore
 
     def recombine(self: A, *others: A) -> None:
         recomb = self.subparameters["recombination"].value
         all_p = [self] + list(others)
         if recomb == "average":
-            self.set_standardized_data(np.mean([self.get_standardized_data(p) for p in all_p], axis=0), deterministic=False)
+            all_data = np.empty((len(all_p), self.dimension))  # filled in place to avoid stacking a list of arrays
+            for k, p in enumerate(all_p):
+                all_data[k] = self.get_standardized_data(p)
+            self.set_standardized_data(all_data.mean(axis=0), deterministic=False)
         else:
             raise ValueError(f'Unknown recombination "{recomb}"')
 
@@ -202,6 +202,27 @@ def test_array_recombination() -> None:
     assert param2.value[0] == 1.7  # because of different sigma, this is not the "expected" value
 
 
+def test_array_unit_sigma_standardized_data() -> None:
+    param = par.Array(shape=(2,))
+    data = np.array([1, 2])
+    param.set_standardized_data(data)
+    assert param.value.dtype == float
+    data[0] = 12  # make sure the data was not shared
+    np.testing.assert_array_equal(param.value, [1, 2])
+    out = param.get_standardized_data()
+    np.testing.assert_array_equal(out, [1, 2])
+    out += 10  # make sure the instance value is not shared either
+    np.testing.assert_array_equal(param.value, [1, 2])
+
+
+def test_array_value_bounds() -> None:
+    param = par.Array(shape=(2,)).set_bounds(a_min=-3, a_max=3)
+    param.value = np.array([0.5, -0.5])
+    with pytest.raises(ValueError):
+        param.value = np.array([0.5, 4.0])
+    np.testing.assert_array_equal(param.value, [0.5, -0.5])
+
+
 def test_endogeneous_constraint() -> None:
     param = par.Scalar(1.0, mutable_sigma=True)
     param.sigma.register_cheap_constraint(lambda x: False)